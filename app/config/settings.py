@@ -4,7 +4,7 @@ from pathlib import Path
 
 # Directory paths
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+BASE_DIR = Path(__file__).resolve().parents[2]
 
 APP_DIR = BASE_DIR / "app"
 
@@ -13,7 +13,7 @@ ASSETS_DIR = APP_DIR / "assets"
 
 # Application definition
 
-INSTALLED_APPS = [
+INSTALLED_APPS = (
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -24,9 +24,9 @@ INSTALLED_APPS = [
     "djangx.authx",
     "djangx.adminx",
     "app.main",
-]
+)
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -35,7 +35,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # "django.middleware.csp.ContentSecurityPolicyMiddleware",
-]
+)
 
 ROOT_URLCONF = "app.config.urls"
 
@@ -91,7 +91,7 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "Africa/Nairobi"
 
-USE_I18N = True
+USE_I18N = False
 
 USE_TZ = True
 
@@ -116,8 +116,8 @@ MEDIA_ROOT = ASSETS_DIR / "media"
 # https://docs.djangoproject.com/en/dev/howto/csp/
 
 # SECURE_CSP = {
-#     "default-src": [CSP.SELF],
-#     "script-src": [CSP.SELF, CSP.NONCE],
+#     "default-src": (CSP.SELF,),
+#     "script-src": (CSP.SELF, CSP.NONCE),
 #     # Example of the less secure 'unsafe-inline' option.
-#     # "style-src": [CSP.SELF, CSP.UNSAFE_INLINE],
+#     # "style-src": (CSP.SELF, CSP.UNSAFE_INLINE),
 # }
@@ -7,14 +7,90 @@ Usage:
     python manage.py tailwindcss status
 """
 
+import functools
+import os
 import platform
 import shutil
+import stat
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
+# The djangx.ui app directory, resolved once at import
+APP_DIR = Path(__file__).resolve().parents[2]
+
+# Where the Tailwind config CSS file will be copied to
+# and where npm commands will be executed from
+MANAGEMENT_DIR = APP_DIR / "management"
+
+# Output file path - the complete path to the final compiled CSS file
+OUTPUT_CSS_PATH = APP_DIR / "static" / "ui" / "tailwindcss" / "min.css"
+
+# Reported in npm/npx troubleshooting messages
+OS_NAME = platform.system()
+
+
+@functools.cache
+def _which(name, path):
+    """Resolve an executable on PATH, cached per (name, PATH) pair."""
+    return shutil.which(name, path=path)
+
+
+@functools.cache
+def _version(command):
+    """Run ``<command> --version`` once per executable and cache its output."""
+    result = subprocess.run(
+        [command, "--version"], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def _stat(path):
+    """
+    Return ``os.stat(path)``, or None if the path does not exist.
+
+    Like ``os.path.exists``, any ``OSError`` or ``ValueError`` (permission
+    denied, symlink loops, embedded NUL bytes) counts as "does not exist".
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _remove_tree(path):
+    """
+    Remove a directory tree without waiting for the deletion to finish.
+
+    The tree is renamed to a hidden sibling with a single rename, and the
+    sibling is deleted on a background thread. The caller can recreate the
+    directory right away. The thread is not a daemon, so the process waits for
+    the deletion before exiting. On Windows, or if the rename fails (e.g. locked
+    files), the tree is removed synchronously.
+    """
+    if os.name != "nt":
+        trash = path.with_name(f".{path.name}.trash.{os.getpid()}")
+        try:
+            os.rename(path, trash)
+        except OSError:
+            pass
+        else:
+            threading.Thread(
+                target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+            ).start()
+            return
+
+    shutil.rmtree(path)
+
+
+def _format_size(st):
+    """Format the size from a stat result in kilobytes."""
+    return f"{st.st_size / 1024:.2f} KB"
+
 
 def add_tailwindcss_arguments(parser):
     """Shared argument parser for tailwindcss commands."""
@@ -32,6 +108,11 @@ def add_tailwindcss_arguments(parser):
         action="store_true",
         help="Force reinstall by removing node_modules before installation.",
     )
+    install_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Skip installation if node_modules is up to date with package.json and package-lock.json.",
+    )
 
     # build subcommand
     subparsers.add_parser("build", help="Build TailwindCSS (minified)")
@@ -43,18 +124,15 @@ def add_tailwindcss_arguments(parser):
 class Command(BaseCommand):
     help = "Manage TailwindCSS installation and builds"
 
+    # Only drives npm/npx, so skip Django's system checks
+    requires_system_checks = []
+
     def add_arguments(self, parser):
         add_tailwindcss_arguments(parser)
 
     def handle(self, *args, **options):
-        app_dir = Path(__file__).resolve().parent.parent.parent
-
-        # Where the Tailwind config CSS file will be copied to
-        # and where npm commands will be executed from
-        self.management_dir = app_dir / "management"
-
-        # Output file path - the complete path to the final compiled CSS file
-        self.output_css_path = app_dir / "static" / "ui" / "tailwindcss" / "min.css"
+        self.management_dir = MANAGEMENT_DIR
+        self.output_css_path = OUTPUT_CSS_PATH
 
         self.tailwindcss_settings = getattr(settings, "TAILWIND_CSS", {})
 
@@ -62,7 +140,7 @@ class Command(BaseCommand):
 
         match subcommand:
             case "install":
-                self.install(force=options["force"])
+                self.install(force=options["force"], check=options["check"])
             case "build":
                 self.build()
             case "status":
@@ -99,8 +177,10 @@ class Command(BaseCommand):
                 f"TAILWIND_CSS['config'] must be a string or Path object, got: {type(config_setting).__name__}"
             )
 
+        config_stat = _stat(config_path)
+
         # Check if directory / file exists
-        if not config_path.exists():
+        if config_stat is None:
             raise CommandError(
                 (
                     f"TailwindCSS config file not found: {config_path}\n"
@@ -110,7 +190,7 @@ class Command(BaseCommand):
             )
 
         # Check if it's actually file (not a directory)
-        if not config_path.is_file():
+        if not stat.S_ISREG(config_stat.st_mode):
             raise CommandError(
                 f"TAILWIND_CSS['config'] must point to a file, not a directory: {config_path}"
             )
@@ -124,21 +204,33 @@ class Command(BaseCommand):
         dest_config = self.management_dir / "config.css"
 
         try:
-            # Check if source and destination are the same file
-            if source_config.resolve() == dest_config.resolve():
-                # Already in the right place, no need to copy
-                return dest_config
-
-            shutil.copy2(source_config, dest_config)
+            source_stat = os.stat(source_config)
+            dest_stat = _stat(dest_config)
+
+            if dest_stat is not None:
+                # Check if source and destination are the same file
+                if os.path.samestat(source_stat, dest_stat):
+                    # Already in the right place, no need to copy
+                    return dest_config
+
+                # Skip rewriting an identical copy so its mtime stays unchanged
+                # and Tailwind's incremental cache stays warm
+                if (
+                    dest_stat.st_size == source_stat.st_size
+                    and dest_config.read_bytes() == source_config.read_bytes()
+                ):
+                    return dest_config
+
+            shutil.copyfile(source_config, dest_config)
             return dest_config
         except Exception as e:
             raise CommandError(f"Failed to copy config file: {e}")
 
     def _get_npm_command(self):
-        return shutil.which("npm")
+        return _which("npm", os.environ.get("PATH"))
 
     def _get_npx_command(self):
-        return shutil.which("npx")
+        return _which("npx", os.environ.get("PATH"))
 
     def _check_npm(self):
         """Check if npm is available and store the command."""
@@ -153,20 +245,12 @@ class Command(BaseCommand):
                     "After installation, you may need to:\n"
                     "  - Restart your terminal/IDE\n"
                     "  - Add npm to your PATH environment variable\n"
-                    f"  - Current OS: {platform.system()}"
+                    f"  - Current OS: {OS_NAME}"
                 )
             )
 
         self.npm_command = npm_command
 
-        # Verify it works
-        try:
-            subprocess.run([npm_command, "--version"], capture_output=True, check=True)
-        except subprocess.CalledProcessError as e:
-            raise CommandError(
-                f"npm found at '{npm_command}' but failed to execute.\nError: {str(e)}"
-            )
-
     def _check_npx(self):
         """Check if npx is available and store the command."""
         npx_command = self._get_npx_command()
@@ -180,36 +264,89 @@ class Command(BaseCommand):
                     "After installation, you may need to:\n"
                     "  - Restart your terminal/IDE\n"
                     "  - Add npx to your PATH environment variable\n"
-                    f"  - Current OS: {platform.system()}"
+                    f"  - Current OS: {OS_NAME}"
                 )
             )
 
         self.npx_command = npx_command
 
-        # Verify it works
+    def _get_tailwindcss_command(self):
+        """Return the command prefix that runs the Tailwind CLI."""
+        # Run the locally installed CLI directly, skipping npx's own Node startup
+        bin_name = "tailwindcss.cmd" if os.name == "nt" else "tailwindcss"
+        local_bin = self.management_dir / "node_modules" / ".bin" / bin_name
+        if os.access(local_bin, os.X_OK):
+            return [str(local_bin)]
+
+        self._check_npx()
+        return [self.npx_command, "--prefer-offline", "@tailwindcss/cli"]
+
+    def _run(self, command):
+        """Run a command in the management directory, streaming its output."""
         try:
-            subprocess.run([npx_command, "--version"], capture_output=True, check=True)
-        except subprocess.CalledProcessError as e:
+            process = subprocess.Popen(
+                command,
+                cwd=self.management_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            executable = Path(command[0])
             raise CommandError(
-                f"npx found at '{npx_command}' but failed to execute.\nError: {str(e)}"
+                f"{executable.stem} found at '{executable}' but failed to execute.\nError: {str(e)}"
             )
 
+        with process:
+            for line in process.stdout:
+                self.stdout.write(line, ending="")
+
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+    def _node_modules_outdated(self):
+        """Check if package.json or package-lock.json changed since the last install."""
+        # npm writes node_modules/.package-lock.json at the end of every install
+        installed = _stat(self.management_dir / "node_modules" / ".package-lock.json")
+        if installed is None:
+            return True
+
+        for name in ("package.json", "package-lock.json"):
+            manifest = _stat(self.management_dir / name)
+            if manifest is not None and manifest.st_mtime_ns > installed.st_mtime_ns:
+                return True
+
+        return False
+
     def _ensure_node_modules(self, force=False):
-        """Ensure node_modules exists, install if not."""
+        """Ensure node_modules exists and is up to date, install if not."""
         node_modules = self.management_dir / "node_modules"
-        if not node_modules.exists() or force:
+        if force or not os.access(node_modules, os.F_OK):
             self.install(force=force)
+        elif self._node_modules_outdated():
+            self.stdout.write("Node dependencies changed. Reinstalling...")
+            self.install()
 
-    def install(self, force=False):
+    def install(self, force=False, check=False):
         """Install tailwindcss dependencies."""
+        if check and not force and not self._node_modules_outdated():
+            self.stdout.write(self.style.SUCCESS("✓ Node dependencies are up to date"))
+            return
+
         self._check_npm()
 
+        # npm ci installs straight from the lockfile, skipping dependency resolution
+        lockfile = self.management_dir / "package-lock.json"
+        npm_subcommand = "ci" if os.access(lockfile, os.F_OK) else "install"
+
         node_modules = self.management_dir / "node_modules"
 
-        if force and node_modules.exists():
+        # npm ci removes an existing node_modules itself before installing
+        if force and npm_subcommand == "install" and os.access(node_modules, os.F_OK):
             self.stdout.write("Force option used. Removing node dependecies...")
             try:
-                shutil.rmtree(node_modules)
+                _remove_tree(node_modules)
                 self.stdout.write(self.style.SUCCESS("✓ Removed node_modules"))
             except Exception as e:
                 raise CommandError(f"Failed to remove node_modules: {e}")
@@ -217,30 +354,29 @@ class Command(BaseCommand):
         self.stdout.write("Installing node dependencies...")
 
         try:
-            result = subprocess.run(
-                [self.npm_command, "install"],
-                cwd=self.management_dir,
-                capture_output=True,
-                text=True,
-                check=True,
+            self._run(
+                [
+                    self.npm_command,
+                    npm_subcommand,
+                    # Skip network round-trips that don't affect the install
+                    "--no-audit",
+                    "--no-fund",
+                    "--no-update-notifier",
+                    "--prefer-offline",
+                ]
             )
 
             self.stdout.write(
                 self.style.SUCCESS("✓ tailwindcss install completed successfully")
             )
 
-            if result.stdout:
-                self.stdout.write(result.stdout)
-
-        except subprocess.CalledProcessError as e:
+        except subprocess.CalledProcessError:
             self.stdout.write(self.style.ERROR("✗ tailwindcss install failed"))
-            self.stdout.write(e.stderr)
             raise CommandError("tailwindcss install failed")
 
     def build(self):
         """Build TailwindCSS"""
         source_config = self._validate_setting()
-        self._check_npx()
         self._ensure_node_modules()
         local_config = self._copy_config(source_config)
 
@@ -248,8 +384,7 @@ class Command(BaseCommand):
 
         try:
             command = [
-                self.npx_command,
-                "@tailwindcss/cli",
+                *self._get_tailwindcss_command(),
                 "-i",
                 str(local_config.name),
                 "-o",
@@ -257,26 +392,16 @@ class Command(BaseCommand):
                 "--minify",
             ]
 
-            result = subprocess.run(
-                command,
-                cwd=self.management_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            self._run(command)
 
             self.stdout.write(self.style.SUCCESS("✓ TailwindCSS build completed"))
 
-            if self.output_css_path.exists():
-                size = self.output_css_path.stat().st_size / 1024
-                self.stdout.write(f"Build size: {size:.2f} KB")
-
-            if result.stdout:
-                self.stdout.write(result.stdout)
+            output_stat = _stat(self.output_css_path)
+            if output_stat is not None:
+                self.stdout.write(f"Build size: {_format_size(output_stat)}")
 
-        except subprocess.CalledProcessError as e:
+        except subprocess.CalledProcessError:
             self.stdout.write(self.style.ERROR("✗ Build failed"))
-            self.stdout.write(e.stderr)
             raise CommandError("TailwindCSS build failed")
 
     def status(self):
@@ -284,57 +409,35 @@ class Command(BaseCommand):
         self.stdout.write(self.style.MIGRATE_HEADING("djangX TailwindCSS Setup Status"))
         self.stdout.write("-" * 50)
 
-        # Check if npm is available and get its version
-        npm_command = self._get_npm_command()
-        if npm_command:
-            try:
-                result = subprocess.run(
-                    [npm_command, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"✓ npm version: {result.stdout.strip()} (at {npm_command})"
-                    )
-                )
-            except subprocess.CalledProcessError:
+        tools = {"npm": self._get_npm_command(), "npx": self._get_npx_command()}
+
+        # Probe npm and npx versions concurrently, each probe spawns a Node process
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            probes = {
+                name: executor.submit(_version, command)
+                for name, command in tools.items()
+                if command
+            }
+
+        # Check if npm and npx are available and report their versions
+        for name, command in tools.items():
+            if not command:
                 self.stdout.write(
-                    self.style.WARNING(
-                        f"⚠ npm found at {npm_command} but failed to execute"
-                    )
+                    self.style.ERROR(f"✗ {name} not found in PATH (OS: {OS_NAME})")
                 )
-        else:
-            self.stdout.write(
-                self.style.ERROR(f"✗ npm not found in PATH (OS: {platform.system()})")
-            )
+                continue
 
-        # Check if npx is available and get its version
-        npx_command = self._get_npx_command()
-        if npx_command:
             try:
-                result = subprocess.run(
-                    [npx_command, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                version = probes[name].result()
                 self.stdout.write(
-                    self.style.SUCCESS(
-                        f"✓ npx version: {result.stdout.strip()} (at {npx_command})"
-                    )
+                    self.style.SUCCESS(f"✓ {name} version: {version} (at {command})")
                 )
-            except subprocess.CalledProcessError:
+            except (OSError, subprocess.CalledProcessError):
                 self.stdout.write(
                     self.style.WARNING(
-                        f"⚠ npx found at {npx_command} but failed to execute"
+                        f"⚠ {name} found at {command} but failed to execute"
                     )
                 )
-        else:
-            self.stdout.write(
-                self.style.ERROR(f"✗ npx not found in PATH (OS: {platform.system()})")
-            )
 
         # Validate TailwindCSS config setting and file existence
         config_valid = True
@@ -348,11 +451,11 @@ class Command(BaseCommand):
         # Check if the compiled output CSS file exists
         # Only check for output file if config validation passed
         if config_valid:
-            if self.output_css_path.exists():
-                size = self.output_css_path.stat().st_size / 1024
+            output_stat = _stat(self.output_css_path)
+            if output_stat is not None:
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f"✓ Output CSS: {self.output_css_path} ({size:.2f} KB)"
+                        f"✓ Output CSS: {self.output_css_path} ({_format_size(output_stat)})"
                     )
                 )
             else:
@@ -1,11 +1,41 @@
+import functools
+
 from django import template
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.template import Context
 from django.utils.safestring import SafeString, mark_safe
 
 register = template.Library()
 
 
+@functools.cache
+def _site_name() -> str:
+    """Return the stripped SITE_NAME setting, read once per process."""
+    return getattr(settings, "SITE_NAME", "").strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _make_title(title: str, separator: str, site_name: str) -> SafeString:
+    """Build the `<title>` tag, cached since a site renders a small set of titles."""
+    if not title:
+        full_title = site_name
+    elif site_name:
+        full_title = f"{title}{separator}{site_name}"
+    else:
+        full_title = title
+    return mark_safe(f"<title>{full_title}</title>")
+
+
+@receiver(setting_changed)
+def _reset_title_caches(*, setting: str, **kwargs) -> None:
+    """Drop cached titles when SITE_NAME is overridden, e.g. in tests."""
+    if setting == "SITE_NAME":
+        _site_name.cache_clear()
+        _make_title.cache_clear()
+
+
 @register.simple_tag(takes_context=True)
 def title(
     context: Context, name: str | None = None, separator: str = " | "
@@ -34,10 +64,7 @@ def title(
     Note:
         Requires SITE_NAME setting to be set for the site name portion.
     """
-    site_name = getattr(settings, "SITE_NAME", "").strip()
     title = name or context.get("page_title")
 
-    full_title = (
-        f"{title}{separator if site_name else ''}{site_name}" if title else site_name
-    )
-    return mark_safe(f"<title>{full_title}</title>")
+    # Coerce lazy translations and other objects so the cache keys on the text
+    return _make_title(str(title) if title else "", separator, _site_name())